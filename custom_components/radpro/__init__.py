@@ -1,7 +1,6 @@
 """RadPro Home Assistant Integration."""
 from __future__ import annotations
 
-import glob
 import logging
 
 import voluptuous as vol
@@ -9,6 +8,7 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import discovery
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers import config_validation as cv
@@ -26,7 +26,12 @@ from .const import (
     DEFAULT_SENSITIVITY_INTERVAL,
     DEFAULT_DEVICEINFO_INTERVAL,
 )
-from .radpro_io import RadProIO
+from .radpro_io import (
+    RadProIO,
+    RadProIOError,
+    async_probe_ports,
+    list_probe_ports,
+)
 from .coordinator import RadProCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -50,52 +55,27 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _candidate_ports() -> list[str]:
-    """Get list of candidate serial ports (blocking, run in executor)."""
-    ports = []
-    ports += sorted(glob.glob("/dev/ttyACM*"))
-    ports += sorted(glob.glob("/dev/ttyUSB*"))
-    # Also check macOS serial ports
-    ports += sorted(glob.glob("/dev/cu.usbmodem*"))
-    ports += sorted(glob.glob("/dev/cu.usbserial*"))
-    # Remove duplicates while preserving order
-    seen, out = set(), []
-    for p in ports:
-        if p not in seen:
-            seen.add(p)
-            out.append(p)
-    return out
-
-
-def _probe_is_radpro(io: RadProIO) -> bool:
-    """Check if device is RadPro: try GET deviceId and wait for OK response."""
-    try:
-        v = io.get("deviceId")
-        return v is not None and len(v) > 0
-    except Exception:
-        return False
-
+async def _auto_detect_port(
+    hass: HomeAssistant, baudrate: int
+) -> tuple[str | None, bool]:
+    """Auto-detect RadPro device on serial ports; the first port that answers wins.
 
-async def _auto_detect_port(hass: HomeAssistant, baudrate: int) -> str | None:
-    """Auto-detect RadPro device on serial ports."""
-    # Run glob in executor to avoid blocking the event loop
-    ports = await hass.async_add_executor_job(_candidate_ports)
-    if not ports:
+    Ports with a known RadPro VID/PID are probed first, the other
+    candidates only if none of them answers. Returns the detected port
+    (or None) and whether a port with a known RadPro VID/PID was present.
+    """
+    # Enumerate ports in executor to avoid blocking the event loop
+    known, others = await hass.async_add_executor_job(list_probe_ports)
+    if not known and not others:
         _LOGGER.debug("No serial ports found for auto-detection")
-        return None
+        return None, False
 
-    _LOGGER.debug("Auto-detecting RadPro on ports: %s", ports)
+    _LOGGER.debug("Auto-detecting RadPro on ports: %s, then %s", known, others)
 
-    for p in ports:
-        io = RadProIO(p, baudrate=baudrate)
-        ok = await hass.async_add_executor_job(_probe_is_radpro, io)
-        try:
-            await hass.async_add_executor_job(io.close)
-        except Exception:
-            pass
-        if ok:
-            return p
-    return None
+    found = await async_probe_ports(
+        (known, others), baudrate, hass.async_add_executor_job
+    )
+    return (found[0] if found else None), bool(known)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -120,7 +100,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     # Auto-detect port if configured
     if str(port).lower() in ("auto", "", "none"):
-        detected = await _auto_detect_port(hass, baudrate)
+        detected, _ = await _auto_detect_port(hass, baudrate)
         if not detected:
             _LOGGER.warning(
                 "RadPro device not found. Integration will not load sensors. "
@@ -154,7 +134,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up RadPro from a config entry."""
+    """Set up RadPro from a config entry.
+
+    If the device is not ready yet (e.g. USB still enumerating after boot),
+    ConfigEntryNotReady hands the entry to HA's background retry instead of
+    failing it; sensor platforms are only set up after a successful refresh.
+    With port "auto" that only happens while a port with a known RadPro
+    VID/PID is present, so a missing device does not re-probe every port
+    on each retry.
+    """
     hass.data.setdefault(DOMAIN, {})
 
     port = entry.data[CONF_PORT]
@@ -163,8 +151,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Auto-detect if port is "auto"
     if str(port).lower() == "auto":
-        detected = await _auto_detect_port(hass, baudrate)
+        detected, known_present = await _auto_detect_port(hass, baudrate)
         if not detected:
+            if known_present:
+                raise ConfigEntryNotReady(
+                    "RadPro USB device present but not responding"
+                )
             _LOGGER.error("RadPro device not found during auto-detection")
             return False
         port = detected
@@ -180,9 +172,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             deviceinfo_interval=DEFAULT_DEVICEINFO_INTERVAL,
             entry_id=entry.entry_id,
         )
-    except Exception as err:
-        _LOGGER.error("Failed to initialize RadPro: %s", err)
-        return False
+    except (RadProIOError, OSError) as err:
+        # OSError includes serial.SerialException from opening the port;
+        # a failed first refresh already raises ConfigEntryNotReady
+        raise ConfigEntryNotReady(f"Failed to initialize RadPro: {err}") from err
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -213,8 +206,14 @@ async def _setup_coordinator(
 
     hass.data[DOMAIN][entry_id] = coordinator
 
-    await coordinator.async_setup()
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_setup()
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Release the serial port and I/O thread before giving up
+        hass.data[DOMAIN].pop(entry_id, None)
+        await coordinator.async_close()
+        raise
 
     async def async_stop_handler(event):
         """Close serial port when Home Assistant stops."""
@@ -238,5 +237,22 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry when options change."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply config entry changes.
+
+    A new scan interval is applied to the running coordinator; the entry is
+    only reloaded (reopening the port) when port or baudrate changed.
+    """
+    coordinator: RadProCoordinator | None = hass.data[DOMAIN].get(entry.entry_id)
+    port = entry.data[CONF_PORT]
+    baudrate = entry.data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)
+    if (
+        coordinator is None
+        or (str(port).lower() != "auto" and port != coordinator.io.port)
+        or baudrate != coordinator.io.baudrate
+    ):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    coordinator.set_scan_interval(
+        entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    )
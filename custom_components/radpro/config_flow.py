@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import selector
 
 from .const import (
@@ -18,8 +19,14 @@ from .const import (
     DEFAULT_PORT,
     DEFAULT_BAUDRATE,
     DEFAULT_SCAN_INTERVAL,
+    PORT_LIST_CACHE_TTL,
+)
+from .radpro_io import (
+    RadProIO,
+    async_probe_ports,
+    list_probe_ports,
+    list_serial_ports,
 )
-from .radpro_io import RadProIO
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,66 +38,62 @@ def _get_serial_ports() -> list[str]:
 
     ports = []
 
-    # Try pyserial's list_ports first (works on all platforms)
+    # Try pyserial's list_ports first (works on all platforms),
+    # known RadPro hardware sorted to the top
     try:
-        import serial.tools.list_ports
-        ports = [p.device for p in serial.tools.list_ports.comports()]
+        ports = list_serial_ports()
     except ImportError:
         pass
 
     # Fallback: glob for Unix-like systems
     if not ports and sys.platform != "win32":
-        # Linux
-        ports += sorted(glob.glob("/dev/ttyACM*"))
-        ports += sorted(glob.glob("/dev/ttyUSB*"))
-        # macOS
-        ports += sorted(glob.glob("/dev/cu.usbmodem*"))
-        ports += sorted(glob.glob("/dev/cu.usbserial*"))
-        ports += sorted(glob.glob("/dev/cu.SLAB_USBtoUART*"))
-        ports += sorted(glob.glob("/dev/cu.wchusbserial*"))
-
-    # Remove duplicates while preserving order
-    seen = set()
-    result = []
-    for p in ports:
-        if p not in seen:
-            seen.add(p)
-            result.append(p)
-    return result
+        ports = sorted({
+            # Linux
+            *glob.glob("/dev/ttyACM*"),
+            *glob.glob("/dev/ttyUSB*"),
+            # macOS
+            *glob.glob("/dev/cu.usbmodem*"),
+            *glob.glob("/dev/cu.usbserial*"),
+            *glob.glob("/dev/cu.SLAB_USBtoUART*"),
+            *glob.glob("/dev/cu.wchusbserial*"),
+        })
+
+    return ports
 
 
 def _test_connection(port: str, baudrate: int) -> tuple[bool, str | None]:
     """Test connection to RadPro device. Returns (success, device_id or error)."""
+    io = RadProIO(port, baudrate=baudrate)
     try:
-        io = RadProIO(port, baudrate=baudrate)
         io.open()
         device_id = io.get("deviceId")
-        io.close()
 
         if device_id:
             return True, device_id
         return False, "No response from device"
     except Exception as err:
         return False, str(err)
+    finally:
+        io.close()
 
 
-def _auto_detect_radpro(ports: list[str], baudrate: int) -> tuple[str | None, str | None]:
-    """Try to find RadPro device on available ports. Returns (port, device_id) or (None, error)."""
-    if not ports:
-        return None, "No serial ports available"
-
-    for port in ports:
-        try:
-            io = RadProIO(port, baudrate=baudrate)
-            io.open()
-            device_id = io.get("deviceId")
-            io.close()
+async def _auto_detect_radpro(
+    hass: HomeAssistant, baudrate: int
+) -> tuple[str | None, str | None]:
+    """Try to find RadPro device on USB serial ports. Returns (port, device_id) or (None, error).
 
-            if device_id:
-                return port, device_id
-        except Exception:
-            continue
+    Only ports auto-detect may probe are tried, not every port in the
+    dropdown, and ports with a known RadPro VID/PID go first.
+    """
+    known, others = await hass.async_add_executor_job(list_probe_ports)
+    if not known and not others:
+        return None, "No serial ports available"
 
+    found = await async_probe_ports(
+        (known, others), baudrate, hass.async_add_executor_job
+    )
+    if found:
+        return found
     return None, "RadPro device not found on any port"
 
 
@@ -101,19 +104,31 @@ class RadProConfigFlow(ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         """Initialize the config flow."""
-        self._discovered_ports: list[str] = []
+        self._discovered_ports: list[str] | None = None
+        self._ports_cached_at: float = 0.0
         self._device_id: str | None = None
 
+    async def _async_get_ports(self) -> list[str]:
+        """Return serial ports, re-enumerating at most once per PORT_LIST_CACHE_TTL."""
+        now = time.monotonic()
+        if (
+            self._discovered_ports is None
+            or now - self._ports_cached_at > PORT_LIST_CACHE_TTL
+        ):
+            self._discovered_ports = await self.hass.async_add_executor_job(
+                _get_serial_ports
+            )
+            self._ports_cached_at = now
+        return self._discovered_ports
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
         errors: dict[str, str] = {}
 
-        # Get available ports
-        self._discovered_ports = await self.hass.async_add_executor_job(
-            _get_serial_ports
-        )
+        # Get available ports (re-enumerated at most every PORT_LIST_CACHE_TTL s)
+        discovered_ports = await self._async_get_ports()
 
         if user_input is not None:
             port = user_input[CONF_PORT]
@@ -121,8 +136,8 @@ class RadProConfigFlow(ConfigFlow, domain=DOMAIN):
 
             # Handle auto-detection
             if port.lower() == "auto":
-                detected_port, result = await self.hass.async_add_executor_job(
-                    _auto_detect_radpro, self._discovered_ports, baudrate
+                detected_port, result = await _auto_detect_radpro(
+                    self.hass, baudrate
                 )
                 if detected_port:
                     port = detected_port
@@ -162,8 +177,8 @@ class RadProConfigFlow(ConfigFlow, domain=DOMAIN):
                 )
 
         # Build port options
-        port_options = ["auto"] + self._discovered_ports
-        if not self._discovered_ports:
+        port_options = ["auto"] + discovered_ports
+        if not discovered_ports:
             port_options = ["auto"]
 
         data_schema = vol.Schema(
@@ -207,7 +222,7 @@ class RadProConfigFlow(ConfigFlow, domain=DOMAIN):
             data_schema=data_schema,
             errors=errors,
             description_placeholders={
-                "discovered_ports": ", ".join(self._discovered_ports) or "none"
+                "discovered_ports": ", ".join(discovered_ports) or "none"
             },
         )
 
@@ -6,9 +6,24 @@ CONF_SCAN_INTERVAL = "scan_interval"
 CONF_SENSITIVITY_INTERVAL = "sensitivity_interval"
 CONF_DEVICEINFO_INTERVAL = "deviceinfo_interval"
 
+# USB (VID, PID) pairs of known RadPro hardware, probed first on auto-detect
+RADPRO_USB_IDS = {
+    (0x0483, 0x5740),   # STM32 USB CDC (Virtual COM Port)
+}
+
 DEFAULT_PORT = "auto"
 DEFAULT_BAUDRATE = 115200
 
 DEFAULT_SCAN_INTERVAL = 2               # seconds
 DEFAULT_SENSITIVITY_INTERVAL = 3600     # 1 hour
 DEFAULT_DEVICEINFO_INTERVAL = 600       # 10 minutes
+
+# Tube sensitivity only changes if the tube is reconfigured: once this many
+# consecutive reads agree, refresh it at the stable interval instead
+SENSITIVITY_STABLE_READS = 2
+SENSITIVITY_STABLE_INTERVAL = 86400     # 24 hours
+
+DEVICE_ID_MAX_ATTEMPTS = 3              # polls that may try to read deviceId
+
+AUTO_DETECT_MAX_PARALLEL = 8            # ports probed at the same time
+PORT_LIST_CACHE_TTL = 30                # seconds, config flow port list
@@ -1,49 +1,77 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
+from typing import Any, TypeVar
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .const import (
+    DEVICE_ID_MAX_ATTEMPTS,
+    SENSITIVITY_STABLE_INTERVAL,
+    SENSITIVITY_STABLE_READS,
+)
 from .radpro_io import RadProIO, RadProIOError
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
 
-@dataclass
+
+def _parse_model(hardware_id: str | None) -> str | None:
+    """Extract model name from hardware_id."""
+    if hardware_id:
+        # "FS2011 (STM32F051C8)" -> "FS2011"
+        return hardware_id.partition("(")[0].strip()
+    return None
+
+
+def _parse_sw_version(software_id: str | None) -> str | None:
+    """Extract version from software_id."""
+    if software_id:
+        # "Rad Pro 2.0/en" -> "Rad Pro 2.0" -> "2.0"
+        head, slash, _ = software_id.partition("/")
+        words = head.split()
+        for word in words:
+            if word[0].isdigit():
+                return word
+        # Otherwise the word before the '/': "RadPro/2.0" -> "RadPro"
+        if slash and words and not head[-1].isspace():
+            return words[-1]
+    return software_id
+
+
+@dataclass(slots=True)
 class DeviceInfo:
     """RadPro device information parsed from GET deviceId response.
     
     Response format: OK [hardware-id];[software-id];[device-id]
     Example: OK FS2011 (STM32F051C8);Rad Pro 2.0/en;b5706d937087f975b5812810
+
+    model and sw_version are derived once in set_identity(), since
+    entities read them on every state write.
     """
     hardware_id: str | None = None      # e.g., "FS2011 (STM32F051C8)"
     software_id: str | None = None      # e.g., "Rad Pro 2.0/en"
     device_id: str | None = None        # e.g., "b5706d937087f975b5812810"
     battery_voltage: float | None = None
+    model: str | None = None            # e.g., "FS2011"
+    sw_version: str | None = None       # e.g., "2.0"
 
-    @property
-    def model(self) -> str | None:
-        """Extract model name from hardware_id."""
-        if self.hardware_id:
-            # "FS2011 (STM32F051C8)" -> "FS2011"
-            return self.hardware_id.split("(")[0].strip()
-        return None
-
-    @property
-    def sw_version(self) -> str | None:
-        """Extract version from software_id."""
-        if self.software_id:
-            # "Rad Pro 2.0/en" -> "2.0"
-            parts = self.software_id.split()
-            for part in parts:
-                if "/" in part:
-                    return part.split("/")[0]
-                if part[0].isdigit():
-                    return part
-        return self.software_id
+    def set_identity(
+        self, hardware_id: str | None, software_id: str | None, device_id: str | None
+    ) -> None:
+        """Set identity fields and re-derive model and sw_version from them."""
+        self.hardware_id = hardware_id
+        self.software_id = software_id
+        self.device_id = device_id
+        self.model = _parse_model(hardware_id)
+        self.sw_version = _parse_sw_version(software_id)
 
 
 class RadProCoordinator(DataUpdateCoordinator[dict]):
@@ -51,7 +79,7 @@ class RadProCoordinator(DataUpdateCoordinator[dict]):
     Polls device using RadPro protocol:
     - tubeRate -> CPM (averaged by device)
     - tubePulseCount -> lifetime pulse counter
-    - tubeSensitivity -> compute µSv/h from CPM
+    - tubeSensitivity -> inv_sensitivity, for sensors to compute µSv/h from CPM
     Uses device's built-in averaging for stable readings.
     """
 
@@ -73,47 +101,104 @@ class RadProCoordinator(DataUpdateCoordinator[dict]):
         self.device_info: DeviceInfo = DeviceInfo()
 
         self._sensitivity: float | None = None  # CPM per µSv/h
+        self._inv_sensitivity: float | None = None  # µSv/h per CPM
+        self._sensitivity_stable_count: int = 0  # consecutive identical reads
 
-        # Intervals for periodic refresh (in update cycles)
-        self._sensitivity_interval = max(1, sensitivity_interval_s // max(1, interval_s))
-        self._deviceinfo_interval = max(1, deviceinfo_interval_s // max(1, interval_s))
+        self._sensitivity_interval_s = sensitivity_interval_s
+        self._deviceinfo_interval_s = deviceinfo_interval_s
         self._update_counter: int = 0
+        self._device_id_attempts: int = 0
+        # Periodic keys waiting to be fetched, oldest first; both start due
+        # so the first polls fetch them
+        self._due_keys: list[str] = ["tubeSensitivity", "deviceBatteryVoltage"]
+        self._set_cycle_intervals(interval_s)
+
+        # All serial I/O runs on one dedicated thread that owns the port,
+        # instead of hopping between threads of the shared HA executor
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="radpro_io"
+        )
+        # Held around every I/O call so close never overlaps a read
+        self._io_lock = asyncio.Lock()
+        self._closed = False
+
+    def _set_cycle_intervals(self, interval_s: int) -> None:
+        """Convert periodic refresh intervals to update cycles."""
+        interval_s = max(1, int(interval_s))
+        self._sensitivity_base_interval = max(1, self._sensitivity_interval_s // interval_s)
+        self._sensitivity_stable_interval = max(
+            self._sensitivity_base_interval,
+            SENSITIVITY_STABLE_INTERVAL // interval_s,
+        )
+        if self._sensitivity_stable_count >= SENSITIVITY_STABLE_READS:
+            self._sensitivity_interval = self._sensitivity_stable_interval
+        else:
+            self._sensitivity_interval = self._sensitivity_base_interval
+        self._deviceinfo_interval = max(1, self._deviceinfo_interval_s // interval_s)
+
+    def set_scan_interval(self, interval_s: int) -> None:
+        """Change the polling interval of the running coordinator."""
+        interval_s = max(1, int(interval_s))
+        self.update_interval = timedelta(seconds=interval_s)
+        self._set_cycle_intervals(interval_s)
+
+    @property
+    def inv_sensitivity(self) -> float | None:
+        """µSv/h per CPM (1 / tubeSensitivity), None until known."""
+        return self._inv_sensitivity
+
+    async def _async_io(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking RadProIO call on the dedicated serial thread."""
+        async with self._io_lock:
+            if self._closed:
+                raise RadProIOError("Serial connection is closed")
+            return await self.hass.loop.run_in_executor(self._io_executor, func, *args)
 
     async def async_setup(self) -> None:
-        # Open port once
-        await self.hass.async_add_executor_job(self.io.open)
+        # Open port once; device identity, battery voltage and sensitivity
+        # are fetched by the first update
+        await self._async_io(self.io.open)
 
-        # Read static-ish info
-        await self._read_device_info()
+    async def _read_device_identity(self) -> None:
+        """Read deviceId in its own exchange, giving up after a few attempts."""
+        self._device_id_attempts += 1
+        self._parse_device_id(await self._async_io(self.io.get, "deviceId"))
+        if (
+            self.device_info.device_id is None
+            and self._device_id_attempts >= DEVICE_ID_MAX_ATTEMPTS
+        ):
+            _LOGGER.warning(
+                "No valid deviceId after %d attempts, not retrying",
+                self._device_id_attempts,
+            )
 
-        # Read sensitivity once on startup (we can refresh later too)
-        await self._read_sensitivity()
+    def _parse_device_id(self, raw_device_id: str | None) -> None:
+        """Parse deviceId response.
 
-    async def _read_device_info(self) -> None:
-        """Read device identification and battery voltage.
-        
         deviceId response format: [hardware-id];[software-id];[device-id]
         Example: FS2011 (STM32F051C8);Rad Pro 2.0/en;b5706d937087f975b5812810
         """
-        raw_device_id = await self.hass.async_add_executor_job(self.io.get, "deviceId")
-        if raw_device_id:
-            parts = raw_device_id.split(";")
-            if len(parts) >= 3:
-                self.device_info.hardware_id = parts[0].strip()
-                self.device_info.software_id = parts[1].strip()
-                self.device_info.device_id = parts[2].strip()
-            elif len(parts) == 1:
-                # Fallback: old format or just device_id
-                self.device_info.device_id = raw_device_id.strip()
-            _LOGGER.debug(
-                "Device info: hardware=%s, software=%s, id=%s",
-                self.device_info.hardware_id,
-                self.device_info.software_id,
-                self.device_info.device_id,
+        if not raw_device_id:
+            return
+        hardware_id, sep, rest = raw_device_id.partition(";")
+        software_id, sep2, device_id = rest.partition(";")
+        if sep2:
+            self.device_info.set_identity(
+                hardware_id.strip(),
+                software_id.strip(),
+                device_id.partition(";")[0].strip(),
             )
+        elif not sep:
+            # Fallback: old format or just device_id
+            self.device_info.device_id = raw_device_id.strip()
+        _LOGGER.debug(
+            "Device info: hardware=%s, software=%s, id=%s",
+            self.device_info.hardware_id,
+            self.device_info.software_id,
+            self.device_info.device_id,
+        )
 
-        # deviceBatteryVoltage
-        bv = await self.hass.async_add_executor_job(self.io.get, "deviceBatteryVoltage")
+    def _parse_battery_voltage(self, bv: str | None) -> None:
         if bv:
             try:
                 self.device_info.battery_voltage = float(bv)
@@ -121,58 +206,111 @@ class RadProCoordinator(DataUpdateCoordinator[dict]):
             except ValueError:
                 _LOGGER.warning("Invalid deviceBatteryVoltage: %s", bv)
 
-    async def _read_sensitivity(self) -> None:
-        s = await self.hass.async_add_executor_job(self.io.get, "tubeSensitivity")
-        if s:
-            try:
-                self._sensitivity = float(s)
-                _LOGGER.debug("Tube sensitivity: %s CPM/(µSv/h)", s)
-            except ValueError:
-                _LOGGER.warning("Invalid tubeSensitivity: %s", s)
+    def _parse_sensitivity(self, s: str | None) -> None:
+        if not s:
+            return
+        try:
+            sensitivity = float(s)
+        except ValueError:
+            _LOGGER.warning("Invalid tubeSensitivity: %s", s)
+            return
+        _LOGGER.debug("Tube sensitivity: %s CPM/(µSv/h)", s)
+
+        # Stretch the refresh interval while the value stays put,
+        # fall back to the configured interval as soon as it moves
+        if sensitivity == self._sensitivity:
+            self._sensitivity_stable_count += 1
+        else:
+            self._sensitivity_stable_count = 1
+        if self._sensitivity_stable_count >= SENSITIVITY_STABLE_READS:
+            self._sensitivity_interval = self._sensitivity_stable_interval
+        else:
+            self._sensitivity_interval = self._sensitivity_base_interval
+        self._sensitivity = sensitivity
+        self._inv_sensitivity = 1.0 / sensitivity if sensitivity > 0 else None
 
     async def _async_update_data(self) -> dict:
         try:
             self._update_counter += 1
 
-            # Periodically refresh sensitivity
-            if self._update_counter % self._sensitivity_interval == 0:
-                await self._read_sensitivity()
+            # Identity is static: read on the first poll (entities are only
+            # created after it, so their unique IDs use the device id) and
+            # retried on a bounded number of polls while it is unknown
+            if (
+                self.device_info.device_id is None
+                and self._device_id_attempts < DEVICE_ID_MAX_ATTEMPTS
+            ):
+                await self._read_device_identity()
+
+            # All keys for this tick are fetched in one call on the I/O thread
+            keys = ["tubeRate", "tubePulseCount"]
 
-            # Periodically refresh device info
-            if self._update_counter % self._deviceinfo_interval == 0:
-                await self._read_device_info()
+            # Periodic refreshes become due on their cycle, but at most one
+            # is served per poll so their cycles never pile up on one tick;
+            # the one that has waited longest goes first, so neither starves
+            if (
+                self._update_counter % self._sensitivity_interval == 0
+                and "tubeSensitivity" not in self._due_keys
+            ):
+                self._due_keys.append("tubeSensitivity")
+            if (
+                self._update_counter % self._deviceinfo_interval == 0
+                and "deviceBatteryVoltage" not in self._due_keys
+            ):
+                self._due_keys.append("deviceBatteryVoltage")
+
+            due_key = self._due_keys.pop(0) if self._due_keys else None
+            if due_key:
+                keys.append(due_key)
+
+            try:
+                values = await self._async_io(self.io.get_many, keys)
+            except RadProIOError:
+                if due_key:
+                    self._due_keys.insert(0, due_key)
+                raise
+
+            # Not answered (get_many stopped at an earlier timeout, or the
+            # reply was not OK): keep it first in line for the next poll
+            # instead of waiting for its next cycle
+            if due_key and values[due_key] is None:
+                self._due_keys.insert(0, due_key)
+
+            if "tubeSensitivity" in values:
+                self._parse_sensitivity(values["tubeSensitivity"])
+            if "deviceBatteryVoltage" in values:
+                self._parse_battery_voltage(values["deviceBatteryVoltage"])
 
             data: dict = {}
 
-            # Read tubeRate (CPM, already averaged by device)
-            rate_s = await self.hass.async_add_executor_job(self.io.get, "tubeRate")
+            # tubeRate is CPM, already averaged by device
+            rate_s = values["tubeRate"]
             if rate_s:
                 try:
+                    # Stored unrounded: sensors round for display via
+                    # suggested_display_precision. CPS and µSv/h are
+                    # derived from CPM by their sensors.
                     cpm = float(rate_s)
-                    cps = cpm / 60.0
-                    data["cps"] = round(cps, 3)
-                    data["cpm"] = round(cpm, 1)
-
-                    # µSv/h = CPM / sensitivity
-                    if self._sensitivity and self._sensitivity > 0:
-                        usvh = cpm / self._sensitivity
-                        data["usvh"] = round(usvh, 3)
-
-                    _LOGGER.debug(
-                        "tubeRate: CPM=%.1f, CPS=%.3f, µSv/h=%s (sensitivity=%.1f)",
-                        cpm, cps, data.get("usvh", "N/A"),
-                        self._sensitivity or 0
-                    )
+                    data["cpm"] = cpm
+
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "tubeRate: CPM=%.1f (sensitivity=%.1f)",
+                            cpm, self._sensitivity or 0
+                        )
                 except ValueError:
                     _LOGGER.warning("Invalid tubeRate: %s", rate_s)
 
-            # Read pulse count (lifetime counter)
-            pc_s = await self.hass.async_add_executor_job(self.io.get, "tubePulseCount")
+            # Pulse count (lifetime counter)
+            pc_s = values["tubePulseCount"]
             if pc_s:
-                try:
+                # Responses are ASCII-only, so isdigit() accepts exactly the
+                # unsigned integers int() would parse: garbage and negative
+                # counts are rejected without raising
+                if pc_s.isdigit():
                     data["pulse_count"] = int(pc_s)
                     _LOGGER.debug("tubePulseCount: %s", pc_s)
-                except ValueError:
+                else:
                     _LOGGER.warning("Invalid tubePulseCount: %s", pc_s)
 
             if not data:
@@ -186,4 +324,9 @@ class RadProCoordinator(DataUpdateCoordinator[dict]):
             raise UpdateFailed(f"Unexpected error: {e}") from e
 
     async def async_close(self) -> None:
-        await self.hass.async_add_executor_job(self.io.close)
+        async with self._io_lock:
+            if self._closed:
+                return
+            self._closed = True
+            await self.hass.loop.run_in_executor(self._io_executor, self.io.close)
+        self._io_executor.shutdown(wait=False)
@@ -1,11 +1,94 @@
 from __future__ import annotations
 
+import asyncio
+import glob
 import logging
 import time
+from collections.abc import Awaitable, Callable
+from fnmatch import fnmatch
+from functools import lru_cache
+from typing import Any
+
 import serial
 
+from .const import AUTO_DETECT_MAX_PARALLEL, RADPRO_USB_IDS
+
 _LOGGER = logging.getLogger(__name__)
 
+READ_TIMEOUT = 0.5  # seconds, per response line
+READ_POLL_INTERVAL = 0.02  # seconds, port read timeout within a line
+
+# USB serial device nodes auto-detect may probe even without USB info
+PROBE_PORT_PATTERNS = (
+    # Linux
+    "/dev/ttyACM*",
+    "/dev/ttyUSB*",
+    # macOS
+    "/dev/cu.usbmodem*",
+    "/dev/cu.usbserial*",
+    "/dev/cu.SLAB_USBtoUART*",
+    "/dev/cu.wchusbserial*",
+)
+
+
+def _port_priority(info) -> tuple[int, str]:
+    """Sort key for pyserial ListPortInfo: known RadPro hardware first."""
+    if (info.vid, info.pid) in RADPRO_USB_IDS:
+        return 0, info.device
+    if "STM" in (info.manufacturer or "") or "Rad" in (info.product or ""):
+        return 1, info.device
+    return 2, info.device
+
+
+@lru_cache(maxsize=32)
+def _encode_get(key: str) -> bytes:
+    """Encoded GET request for key; the coordinator reuses a few keys."""
+    return f"GET {key}\n".encode("ascii")
+
+
+def list_serial_ports() -> list[str]:
+    """List serial ports with likely RadPro devices first (blocking)."""
+    from serial.tools import list_ports
+
+    infos = sorted(list_ports.comports(), key=_port_priority)
+    return [p.device for p in infos]
+
+
+def _is_probe_candidate(info) -> bool:
+    """Whether auto-detect may send GET deviceId to this port.
+
+    Only USB serial ports qualify; on-board UARTs and Bluetooth ports
+    (ttyS*, ttyAMA*, rfcomm*) can only be selected manually.
+    """
+    return info.vid is not None or any(
+        fnmatch(info.device, pattern) for pattern in PROBE_PORT_PATTERNS
+    )
+
+
+def list_probe_ports() -> tuple[list[str], list[str]]:
+    """List ports for auto-detect (blocking).
+
+    Returns (known, others): ports with a known RadPro USB VID/PID, and
+    the remaining candidates with likely RadPro devices first.
+    """
+    try:
+        from serial.tools import list_ports
+    except ImportError:
+        return [], sorted(
+            {p for pattern in PROBE_PORT_PATTERNS for p in glob.glob(pattern)}
+        )
+
+    known: list[str] = []
+    others: list[str] = []
+    for info in sorted(
+        filter(_is_probe_candidate, list_ports.comports()), key=_port_priority
+    ):
+        if (info.vid, info.pid) in RADPRO_USB_IDS:
+            known.append(info.device)
+        else:
+            others.append(info.device)
+    return known, others
+
 
 class RadProIOError(Exception):
     """Protocol / transport error."""
@@ -15,26 +98,67 @@ class RadProIO:
     """
     Minimal RadPro serial I/O compatible with radpro-tool.py:
     - write: ASCII + '\n'
-    - read: readline
+    - read: one line via the buffered _readline(), bounded by READ_TIMEOUT
     - parse: 'OK ' prefix -> return value
     """
     def __init__(self, port: str, baudrate: int = 115200) -> None:
         self.port = port
         self.baudrate = baudrate
         self.serial: serial.Serial | None = None
+        self._buf = bytearray()  # received bytes not yet returned as a line
 
     def open(self) -> None:
         self.serial = serial.Serial(
             port=self.port,
             baudrate=self.baudrate,
-            timeout=0.5,
-            write_timeout=0.5,
+            # Fixed short read timeout, set once: _readline() polls in
+            # slices until its own deadline, so the port never needs to be
+            # reconfigured mid-exchange
+            timeout=READ_POLL_INTERVAL,
+            write_timeout=READ_TIMEOUT,
         )
 
     def close(self) -> None:
         if self.serial and self.serial.is_open:
             self.serial.close()
         self.serial = None
+        self._buf.clear()
+
+    def _readline(self) -> bytes:
+        """
+        Read one line through the receive buffer.
+        Reads everything the driver has waiting in one call instead of
+        pyserial's byte-at-a-time readline(), and returns as soon as the
+        newline arrives. The whole line must arrive within READ_TIMEOUT;
+        the deadline is checked between reads of at most READ_POLL_INTERVAL,
+        so noise without a newline cannot stretch the wait by more than
+        that. On timeout returns b"" and drops any partial line, so a
+        truncated value is never parsed.
+        """
+        assert self.serial is not None
+        deadline = time.monotonic() + READ_TIMEOUT
+        while (idx := self._buf.find(b"\n")) < 0:
+            if time.monotonic() >= deadline:
+                if self._buf:
+                    _LOGGER.debug("RX: (incomplete) %s", bytes(self._buf))
+                self._buf.clear()
+                return b""
+            self._buf += self.serial.read(max(1, self.serial.in_waiting))
+        line = bytes(self._buf[: idx + 1])
+        del self._buf[: idx + 1]
+        return line
+
+    def _exchange(self, request: bytes) -> bytes:
+        """
+        Send one request line and read its response (b"" on timeout).
+        Input left over from an earlier timed-out exchange is discarded
+        first, so a late reply is never taken as the answer to this request.
+        """
+        assert self.serial is not None
+        self.serial.reset_input_buffer()
+        self._buf.clear()
+        self.serial.write(request)
+        return self._readline()
 
     def query(self, request: str) -> str | None:
         """
@@ -50,29 +174,113 @@ class RadProIO:
         try:
             assert self.serial is not None
             _LOGGER.debug("TX: %s", request)
-            self.serial.write(request.encode("ascii") + b"\n")
-            response_bytes = self.serial.readline()
+            response_bytes = self._exchange(request.encode("ascii") + b"\n")
         except Exception as e:
             _LOGGER.debug("Serial error: %s", e)
             self.serial = None
             raise RadProIOError(str(e)) from e
 
-        time.sleep(0.05)
-
         if not response_bytes:
             _LOGGER.debug("RX: (no response)")
             return None
 
-        response = response_bytes.decode("ascii", errors="ignore").strip()
+        return self._parse_response(response_bytes)
+
+    def get_many(self, keys: list[str]) -> dict[str, str | None]:
+        """
+        GET several keys in one call: each request is sent and its response
+        read before the next one (the protocol is strictly request/response).
+        After the first timeout the remaining keys are not sent and stay
+        None, so a silent device costs one timeout per call, not one per key.
+        Returns {key: value or None}.
+        """
+        if self.serial is None:
+            self.open()
+
+        values: dict[str, str | None] = dict.fromkeys(keys)
+        try:
+            assert self.serial is not None
+            for key in keys:
+                _LOGGER.debug("TX: GET %s", key)
+                response_bytes = self._exchange(_encode_get(key))
+                if not response_bytes:
+                    _LOGGER.debug("RX: (no response for %s)", key)
+                    break
+                values[key] = self._parse_response(response_bytes)
+        except Exception as e:
+            _LOGGER.debug("Serial error: %s", e)
+            self.serial = None
+            raise RadProIOError(str(e)) from e
+
+        return values
+
+    @staticmethod
+    def _parse_response(response_bytes: bytes) -> str | None:
+        # Check the prefix on bytes; only the payload of an OK is decoded
+        response = response_bytes.strip()
         _LOGGER.debug("RX: %s", response)
 
-        if response.startswith("OK"):
+        if response[:2] == b"OK":
             # In radpro-tool: response[3:]
-            return response[3:].strip()
+            return response[3:].strip().decode("ascii", errors="ignore")
         return None
 
     def get(self, key: str) -> str | None:
-        return self.query(f"GET {key}")
+        return self.get_many([key])[key]
 
     def set(self, key: str, value: str | int | float) -> str | None:
-        return self.query(f"SET {key} {value}")
+        result = self.query(f"SET {key} {value}")
+        # Give the device time to apply the setting before the next command
+        time.sleep(0.05)
+        return result
+
+
+def probe_device_id(port: str, baudrate: int) -> str | None:
+    """Open port, send GET deviceId and close it again (blocking).
+
+    Returns the deviceId if the device answered OK, else None. The port is
+    closed in the same thread that probed it, so an abandoned probe never
+    leaves a serial handle open.
+    """
+    io = RadProIO(port, baudrate=baudrate)
+    try:
+        return io.get("deviceId") or None
+    except Exception as err:
+        _LOGGER.debug("Probe of %s failed: %s", port, err)
+        return None
+    finally:
+        io.close()
+
+
+async def async_probe_ports(
+    port_groups: tuple[list[str], ...],
+    baudrate: int,
+    run_blocking: Callable[..., Awaitable[Any]],
+) -> tuple[str, str] | None:
+    """Find a RadPro on the given ports. Returns (port, device_id) or None.
+
+    Groups are tried in order and a group is only probed if no port of
+    the previous ones answered, so other USB devices (Zigbee, Z-Wave
+    sticks) are not sent GET deviceId when a known RadPro port responds.
+    Within a group ports are probed concurrently, at most
+    AUTO_DETECT_MAX_PARALLEL at a time, through run_blocking
+    (hass.async_add_executor_job); the first port that answers wins and
+    the remaining probes are cancelled.
+    """
+    semaphore = asyncio.Semaphore(AUTO_DETECT_MAX_PARALLEL)
+
+    async def _probe(port: str) -> tuple[str, str | None]:
+        async with semaphore:
+            return port, await run_blocking(probe_device_id, port, baudrate)
+
+    for ports in port_groups:
+        tasks = [asyncio.create_task(_probe(p)) for p in ports]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                port, device_id = await fut
+                if device_id:
+                    return port, device_id
+        finally:
+            for task in tasks:
+                task.cancel()
+    return None
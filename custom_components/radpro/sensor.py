@@ -4,7 +4,7 @@ from __future__ import annotations
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -68,25 +68,35 @@ class RadProSensorBase(SensorEntity):
     """Base class for RadPro sensors with common device info."""
 
     _attr_has_entity_name = True
+    # State is pushed from the coordinator listener; platform polling would
+    # write it again every 30 s regardless of changes
+    _attr_should_poll = False
 
     def __init__(self, coordinator: RadProCoordinator) -> None:
         """Initialize the sensor."""
         self.coordinator = coordinator
         # Store device_id at init time to ensure consistent identifiers
         self._device_id = coordinator.device_info.device_id or f"radpro_{coordinator.io.port.replace('/', '_')}"
+        # Built DeviceInfo, reused until the device identity changes
+        self._device_info_key: tuple[str | None, str | None, str | None] | None = None
+        self._device_info_cache: DeviceInfo | None = None
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info to link all sensors to one device."""
         di = self.coordinator.device_info
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=f"RadPro {di.model or 'Dosimeter'}",
-            manufacturer="Gissio",
-            model=di.hardware_id or "RadPro",
-            sw_version=di.sw_version,
-            serial_number=di.device_id,
-        )
+        key = (di.hardware_id, di.software_id, di.device_id)
+        if self._device_info_cache is None or key != self._device_info_key:
+            self._device_info_key = key
+            self._device_info_cache = DeviceInfo(
+                identifiers={(DOMAIN, self._device_id)},
+                name=f"RadPro {di.model or 'Dosimeter'}",
+                manufacturer="Gissio",
+                model=di.hardware_id or "RadPro",
+                sw_version=di.sw_version,
+                serial_number=di.device_id,
+            )
+        return self._device_info_cache
 
     @property
     def available(self) -> bool:
@@ -96,9 +106,14 @@ class RadProSensorBase(SensorEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self.async_write_ha_state()
+
 
 class RadProValueSensor(RadProSensorBase):
     """Sensor for radiation measurements (CPS, CPM, µSv/h, pulse count)."""
@@ -125,13 +140,42 @@ class RadProValueSensor(RadProSensorBase):
         self._attr_state_class = state_class
         if precision is not None:
             self._attr_suggested_display_precision = precision
+        self._last_written: tuple | None = None
+        # Value is pushed on coordinator updates instead of read via property
+        self._attr_native_value = self._current_value()
 
-    @property
-    def native_value(self):
-        """Return the sensor value."""
+    def _current_value(self):
+        """Return the sensor value from the latest coordinator data.
+
+        The coordinator only stores CPM; CPS and µSv/h are derived from it.
+        """
         data = self.coordinator.data or {}
+        if self.key == "cps":
+            cpm = data.get("cpm")
+            return cpm / 60.0 if cpm is not None else None
+        if self.key == "usvh":
+            cpm = data.get("cpm")
+            inv_sensitivity = self.coordinator.inv_sensitivity
+            if cpm is None or inv_sensitivity is None:
+                return None
+            return cpm * inv_sensitivity
         return data.get(self.key)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Store the new value; write state only if it or availability changed.
+
+        At low background most polls repeat the previous value (pulse count
+        in particular), so this skips building an identical state.
+        """
+        value = self._current_value()
+        current = (value, self.available)
+        if current == self._last_written:
+            return
+        self._last_written = current
+        self._attr_native_value = value
+        self.async_write_ha_state()
+
 
 class RadProDeviceInfoSensor(RadProSensorBase):
     """Diagnostic sensor showing device ID and battery voltage."""
@@ -144,13 +188,22 @@ class RadProDeviceInfoSensor(RadProSensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{self._device_id}_device_info"
+        # Attributes dict, reused until the device info it was built from changes
+        self._attrs_key: tuple | None = None
+        self._attrs_cache: dict = {}
+        self._attr_native_value = self._current_value()
 
-    @property
-    def native_value(self):
+    def _current_value(self) -> str:
         """Return the software version as the sensor state."""
         di = self.coordinator.device_info
         return di.software_id or di.device_id or "unknown"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Store the new state and write it."""
+        self._attr_native_value = self._current_value()
+        super()._handle_coordinator_update()
+
     @property
     def extra_state_attributes(self) -> dict:
         """Return additional attributes parsed from deviceId response.
@@ -159,13 +212,17 @@ class RadProDeviceInfoSensor(RadProSensorBase):
         Example: FS2011 (STM32F051C8);Rad Pro 2.0/en;b5706d937087f975b5812810
         """
         di = self.coordinator.device_info
-        attrs = {
-            "hardware_id": di.hardware_id,
-            "software_id": di.software_id,
-            "device_id": di.device_id,
-            "model": di.model,
-            "version": di.sw_version,
-            "port": self.coordinator.io.port,
-            "battery_voltage_per_cell": di.battery_voltage,
-        }
-        return {k: v for k, v in attrs.items() if v is not None}
+        key = (di.hardware_id, di.software_id, di.device_id, di.battery_voltage)
+        if key != self._attrs_key:
+            self._attrs_key = key
+            attrs = {
+                "hardware_id": di.hardware_id,
+                "software_id": di.software_id,
+                "device_id": di.device_id,
+                "model": di.model,
+                "version": di.sw_version,
+                "port": self.coordinator.io.port,
+                "battery_voltage_per_cell": di.battery_voltage,
+            }
+            self._attrs_cache = {k: v for k, v in attrs.items() if v is not None}
+        return self._attrs_cache